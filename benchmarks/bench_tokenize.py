@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+# Purpose: Compares the speed of plotit's command tokenizer against the
+# original one, which sliced the remaining string after every token
+#
+# See the file "LICENSE" for information on usage and redistribution
+# of this file, and for a DISCLAIMER OF ALL WARRANTIES.
+
+import imp
+import os.path
+import random
+import re
+import timeit
+
+
+PLOTIT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..',
+    'plotit')
+
+
+#
+# The original tokenizer
+#
+
+WORD   = r'(\\.)|[^"\'\s]'
+DWORD  = r'(\\.)|[^"\s]'
+SWORD  = r'(\\.)|[^\'\s]'
+DQUOTE = r'%s| |\t' % SWORD
+SQUOTE = r'%s| |\t' % SWORD
+RE_SKIP  = re.compile(r'\s+')
+RE_TOKEN = re.compile(r'(%s)+|("(%s|(\\.))*")|(\'(%s|(\\.))*\')' % (WORD,
+    DQUOTE, SQUOTE))
+
+def original_tokenize(string, limit=None):
+    tokens = []
+
+    while string:
+        m = RE_SKIP.match(string)
+        if m is not None:
+            string = string[m.end():]
+
+        if not string:
+            break
+
+        if limit is not None and len(tokens) == limit:
+            tokens.append(string)
+            break
+
+        m = RE_TOKEN.match(string)
+
+        if m is None:
+            return None
+
+        tok = string[:m.end()]
+        if tok.startswith('"') or tok.startswith('\''):
+            tok = tok[1:-1]
+        tokens.append(tok)
+        string = string[m.end():]
+
+    return tokens
+
+
+#
+# Benchmark
+#
+
+def random_command(rng):
+    alphabet = 'ab1.5 \t"\'\\'
+    return ''.join([rng.choice(alphabet) for i in range(rng.randint(0, 12))])
+
+
+def check(tokenize, count=20000):
+    rng = random.Random(0)
+    for i in xrange(count):
+        command = random_command(rng)
+        for limit in (None, 0, 1, 2):
+            expected = original_tokenize(command, limit)
+            actual = tokenize(command, limit)
+            if actual != expected:
+                raise AssertionError('tokenize(%r, %r) returned %r not %r'
+                    % (command, limit, actual, expected))
+
+
+def bench(name, tokenize, command, number):
+    elapsed = timeit.Timer(lambda: tokenize(command)).timeit(number)
+    print '  %-10s %8.1f usec/call' % (name, elapsed / number * 1e6)
+
+
+def main():
+    plotit = imp.load_source('plotit', PLOTIT)
+    check(plotit.tokenize)
+
+    columns = ['%.6e' % (x * 0.37) for x in range(64)]
+    commands = [
+        ('data, 8 columns', 'data ' + ' '.join(columns[:8])),
+        ('data, 64 columns', 'data ' + ' '.join(columns)),
+        ('legend', 'set legend ' + ' '.join(['"I0 %d"' % x
+            for x in range(16)])),
+        ('title', 'set title "scan 12 \\"Fe K-edge\\" sample A"'),
+    ]
+
+    for description, command in commands:
+        number = max(1000, 200000 // len(command))
+        print '%s (%d characters):' % (description, len(command))
+        bench('original', original_tokenize, command, number)
+        bench('plotit', plotit.tokenize, command, number)
+
+
+if __name__ == '__main__':
+    main()
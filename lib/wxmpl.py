@@ -18,8 +18,12 @@ missing features in the form of a better matplolib FigureCanvas.
 
 import wx
 import sys
+import time
+import bisect
 import os.path
 import weakref
+import threading
+import traceback
 
 import matplotlib
 matplotlib.use('WXAgg')
@@ -30,8 +34,14 @@ from matplotlib.backends.backend_agg import FigureCanvasAgg, RendererAgg
 from matplotlib.backends.backend_wxagg import FigureCanvasWxAgg
 from matplotlib.figure import Figure
 from matplotlib.font_manager import FontProperties
+from matplotlib.patches import Rectangle
 from matplotlib.transforms import Bbox
 
+try:
+    from matplotlib.backends.backend_wxagg import _convert_agg_to_wx_bitmap
+except ImportError:
+    _convert_agg_to_wx_bitmap = None
+
 __version__ = '2.1.0'
 
 __all__ = ['PlotPanel', 'PlotFrame', 'PlotApp', 'StripCharter', 'Channel',
@@ -70,7 +80,13 @@ def find_axes(canvas, x, y):
     coordinates C{xdata, ydata} as a 3-tuple.
 
     If no axes contains the specified point a 3-tuple of C{None} is returned.
+    The C{AxesIndex} of a C{PlotPanel} is used to find the axes if there is
+    one.
     """
+    index = getattr(canvas, 'axesIndex', None)
+    if index is not None:
+        return index.find(x, y)
+
     evt = matplotlib.backend_bases.MouseEvent('', canvas, x, y)
 
     axes = None
@@ -350,8 +366,8 @@ class PlotPanelDirector:
         if axes is not None:
             xdata, ydata = invert_point(x, y, axes.transData)
             if self.zoomEnabled:
-                if self.limits.set(axes, xrange, yrange):
-                    self.view.draw()
+                view.call_after_render(
+                    lambda: self.setLimits(axes, xrange, yrange))
             else:
                 bbox = Bbox.from_extents(x0, y0, x, y)
                 x1, y1, x2, y2 = limit_selection(bbox, axes)
@@ -379,10 +395,24 @@ class PlotPanelDirector:
         """
         view = self.view
         axes, xdata, ydata = find_axes(view, x, y)
-        if (axes is not None and self.zoomEnabled and self.rightClickUnzoom
-        and self.limits.restore(axes)):
+        if axes is not None and self.zoomEnabled and self.rightClickUnzoom:
+            view.call_after_render(lambda: self.restoreLimits(axes, x, y))
+
+    def setLimits(self, axes, xrange, yrange):
+        """
+        Zooms the C{axes} in to the X and Y ranges of an area selection.
+        """
+        if self.limits.set(axes, xrange, yrange):
+            self.view.request_draw()
+
+    def restoreLimits(self, axes, x, y):
+        """
+        Zooms the C{axes} back out after a right-click at C{(x, y)}.
+        """
+        view = self.view
+        if self.limits.restore(axes):
             view.crosshairs.clear()
-            view.draw()
+            view.request_draw()
             view.crosshairs.set(x, y)
 
     def mouseMotion(self, evt, x, y):
@@ -714,6 +744,241 @@ class CursorChanger:
             self.view.SetCursor(wx.CROSS_CURSOR)
 
 
+class AxesIndex:
+    """
+    Finds the axes of a canvas' figure which contains a point, like
+    C{find_axes()}, without examining every axes or inverting its data
+    transform from scratch each time.  The axes' bounding boxes are kept
+    sorted by their left edges and are recomputed after the figure is drawn
+    or resized, or axes are added or removed.  The inverted data transform of
+    each axes is kept until its view limits, scales, or bounding box change.
+    """
+    def __init__(self, canvas):
+        """
+        Create a new C{AxesIndex} for the figure of a matplotlib
+        C{FigureCanvas}.
+        """
+        self.canvas = canvas
+        self.invalidate()
+        canvas.mpl_connect('draw_event', self.invalidate)
+        canvas.mpl_connect('resize_event', self.invalidate)
+
+    def invalidate(self, evt=None):
+        """
+        Discard the cached bounding boxes and inverted transforms.
+        """
+        self.axes = None
+        self.lefts = []
+        self.entries = []
+        self.inverses = {}
+
+    def find(self, x, y):
+        """
+        Returns the axes containing the canvas coordinates C{(x, y)} and the
+        corresponding data coordinates as a 3-tuple, or a 3-tuple of C{None}
+        if no axes or more than one axes contains the point.
+        """
+        axes = self.canvas.get_figure().get_axes()
+        if self.axes != axes:
+            self._build(axes)
+
+        found = None
+        evt = None
+        for i in range(bisect.bisect_right(self.lefts, x)-1, -1, -1):
+            x0, x1, y0, y1, rectangular, a = self.entries[i]
+            if not (x <= x1 and y0 <= y <= y1):
+                continue
+            elif not rectangular:
+                if evt is None:
+                    evt = matplotlib.backend_bases.MouseEvent('', self.canvas,
+                        x, y)
+                if not a.in_axes(evt):
+                    continue
+
+            if found is None:
+                found = a
+            else:
+                return None, None, None
+
+        if found is None:
+            return None, None, None
+
+        xdata, ydata = self.invert(found, x, y)
+        return found, xdata, ydata
+
+    def invert(self, axes, x, y):
+        """
+        Returns the canvas coordinates C{(x, y)} converted to the data
+        coordinates of C{axes}.
+        """
+        key = (tuple(axes.viewLim.bounds), tuple(axes.bbox.bounds),
+            axes.get_xscale(), axes.get_yscale())
+        cached = self.inverses.get(axes)
+        if cached is None or cached[0] != key:
+            cached = self.inverses[axes] = (key,
+                axes.transData.inverted().frozen())
+        return cached[1].transform_point((x, y))
+
+    def _build(self, axes):
+        """
+        Index the bounding boxes of the list of C{axes}.
+        """
+        entries = []
+        for a in axes:
+            x0, y0, x1, y1 = a.bbox.extents
+            rectangular = isinstance(a.patch, Rectangle)
+            entries.append((min(x0, x1), max(x0, x1), min(y0, y1),
+                max(y0, y1), rectangular, a))
+
+        entries.sort(key=lambda e: e[0])
+        self.axes = list(axes)
+        self.lefts = [e[0] for e in entries]
+        self.entries = entries
+        self.inverses = {}
+
+
+class LineDecimator:
+    """
+    Reduces lines that have many more points than their axes has pixel
+    columns to the first, last, minimum, and maximum points in each column.
+    The reduced line looks the same as the original, but drawing it takes time
+    proportional to the width of the axes instead of the number of points.
+
+    Lines only hold their reduced data while the figure is being drawn:
+    C{reduce()} gives it to them and C{restore()} puts their original data
+    back, so the data, hit testing, and data limits of the lines are
+    unaffected.  The reduced data is kept until the line's data, the view
+    limits, or the size of its axes change.  Lines with markers and lines
+    whose X data is not sorted are left alone.
+
+    @cvar THRESHOLD: Lines are reduced when they have more than this many
+    visible points per pixel column (defaults to C{4})
+    """
+
+    THRESHOLD = 4
+
+    def __init__(self, enabled=True):
+        """
+        Create a new C{LineDecimator}.  The keyword argument C{enabled} has the
+        same meaning as the argument to the C{setEnabled()} method.
+        """
+        self.enabled = enabled
+        self.lines = weakref.WeakKeyDictionary()
+
+    def setEnabled(self, state):
+        """
+        Enable or disable this decimator.
+        """
+        self.enabled = state
+        if not state:
+            self.lines.clear()
+
+    def reduce(self, axes):
+        """
+        Give the lines of C{axes} their reduced data for its current view
+        limits and size, returning a list of their original data to be passed
+        to C{restore()} once they have been drawn.
+        """
+        saved = []
+        if not self.enabled:
+            return saved
+
+        for line in axes.get_lines():
+            reduced = self.decimate(axes, line)
+            if reduced is not None:
+                saved.append((line, line.get_xdata(orig=True),
+                    line.get_ydata(orig=True)))
+                line.set_data(*reduced)
+        return saved
+
+    def restore(self, saved):
+        """
+        Give lines back the original data returned by C{reduce()}.
+        """
+        for line, x, y in saved:
+            line.set_data(x, y)
+
+    def decimate(self, axes, line):
+        """
+        Returns the reduced data of the C{line} of C{axes} for the current
+        view limits and size of the axes as the 2-tuple C{(x, y)}, or C{None}
+        if the line is not reduced.
+        """
+        x = line.get_xdata(orig=True)
+        y = line.get_ydata(orig=True)
+        key = (tuple(axes.viewLim.intervalx), int(axes.bbox.width), len(x))
+
+        state = self.lines.get(line)
+        if (state is not None and state[0] is x and state[1] is y
+        and state[2] == key):
+            return state[3]
+
+        reduced = None
+        if (line.get_transform() == axes.transData
+        and line.get_marker() in (None, 'None', 'none', '', ' ')):
+            reduced = decimate_minmax(axes, x, y, self.THRESHOLD)
+
+        self.lines[line] = (x, y, key, reduced)
+        return reduced
+
+
+def decimate_minmax(axes, x, y, threshold):
+    """
+    Returns the points of C{(x, y)} that are needed to draw it at the current
+    view limits and size of C{axes}: the first, last, minimum, and maximum
+    points of each pixel column, along with any missing points.  If there are
+    no more than C{threshold} visible points per pixel column, only the visible
+    points are returned.  C{None} is returned if the line is too short to be
+    worth reducing or its X data is not sorted.
+    """
+    width = int(axes.bbox.width)
+    if width < 1 or len(x) <= threshold*width:
+        return None
+
+    try:
+        x = np.ma.filled(np.ma.asarray(x, np.float), np.nan)
+        y = np.ma.filled(np.ma.asarray(y, np.float), np.nan)
+    except (TypeError, ValueError):
+        return None
+
+    if x.ndim != 1 or x.shape != y.shape:
+        return None
+
+    # work in the axis' scale, so that log axes are divided evenly
+    scale = axes.xaxis.get_transform()
+    xs = np.asarray(scale.transform(x), np.float)
+    lo, hi = np.sort(scale.transform(np.asarray(axes.viewLim.intervalx)))
+    if not (hi > lo) or not (np.diff(xs) >= 0).all():
+        return None
+
+    # keep the nearest point on either side of the view limits, so lines are
+    # drawn right up to the edge of the axes
+    i0 = max(xs.searchsorted(lo, 'left') - 1, 0)
+    i1 = min(xs.searchsorted(hi, 'right') + 1, xs.shape[0])
+
+    xs = xs[i0:i1]
+    x = x[i0:i1]
+    y = y[i0:i1]
+    if i1 - i0 <= threshold*width:
+        return x, y
+
+    columns = np.floor((xs - lo) * (width / (hi - lo)))
+    columns = np.clip(columns, -1, width).astype(np.int_)
+
+    first = np.flatnonzero(np.r_[True, columns[1:] != columns[:-1]])
+    last = np.r_[first[1:] - 1, columns.shape[0] - 1]
+    bins = np.repeat(np.arange(first.shape[0]), last - first + 1)
+
+    keep = [first, last, np.flatnonzero(np.isnan(y))]
+    for extremum in (np.fmin, np.fmax):
+        candidates = np.flatnonzero(y == extremum.reduceat(y, first)[bins])
+        cbins = bins[candidates]
+        keep.append(candidates[np.r_[True, cbins[1:] != cbins[:-1]]])
+
+    idx = np.unique(np.concatenate(keep))
+    return x[idx], y[idx]
+
+
 #
 # Printing Framework
 #
@@ -1093,7 +1358,8 @@ class PlotPanel(FigureCanvasWxAgg):
     """
     def __init__(self, parent, id, size=(6.0, 3.70), dpi=96, cursor=True,
      location=True, crosshairs=True, selection=True, zoom=True,
-     autoscaleUnzoom=True):
+     autoscaleUnzoom=True, decimate=False, maxFrameRate=None,
+     threadedRendering=False):
         """
         Creates a new PlotPanel window that is the child of the wxPython window
         C{parent} with the wxPython identifier C{id}.
@@ -1104,13 +1370,31 @@ class PlotPanel(FigureCanvasWxAgg):
         C{(width, height)}.  C{dpi} is the dots-per-inch of the figure.
 
         The keyword arguments C{cursor}, C{location}, C{crosshairs},
-        C{selection}, C{zoom}, and C{autoscaleUnzoom} enable or disable various
-        user interaction features that are descibed in their associated
-        C{set()} methods.
+        C{selection}, C{zoom}, C{autoscaleUnzoom}, and C{decimate} enable or
+        disable various user interaction features that are descibed in their
+        associated C{set()} methods.
+
+        The keyword arguments C{maxFrameRate} and C{threadedRendering} have
+        the same meanings as the arguments to the C{set_max_frame_rate()} and
+        C{set_threaded_rendering()} methods.
         """
         FigureCanvasWxAgg.__init__(self, parent, id, Figure(size, dpi))
 
         self.insideOnPaint = False
+        self.maxFrameRate = maxFrameRate
+        self.drawPending = False
+        self.lastDrawTime = 0.0
+        self.drawDuration = 0.0
+        self.drawRequests = 0
+        self.coalescedDraws = 0
+        self.threadedRendering = False
+        self.set_threaded_rendering(threadedRendering)
+        self.renderThread = None
+        self.renderGeneration = 0
+        self.renderSaved = []
+        self.afterRender = []
+        self.decimator = LineDecimator(decimate)
+        self.axesIndex = AxesIndex(self)
         self.cursor = CursorChanger(self, cursor)
         self.location = LocationPainter(self, location)
         self.crosshairs = CrosshairPainter(self, crosshairs)
@@ -1234,26 +1518,155 @@ class PlotPanel(FigureCanvasWxAgg):
         """
         self.director.setAutoscaleUnzoom(state)
 
+    def set_decimation(self, state):
+        """
+        Enable or disable reducing lines with many more points than there are
+        pixels across their axes to the minimum and maximum of each pixel
+        column before they are drawn.  The lines keep their original data,
+        which is only replaced while they are being drawn.
+        """
+        self.decimator.setEnabled(state)
+
+    def set_threaded_rendering(self, state):
+        """
+        Enable or disable rendering the figure on a worker thread.  When
+        enabled, C{draw()} returns immediately and the finished frame is shown
+        once it is ready, so the user interface stays responsive while large
+        figures are rendered.
+
+        The figure must not be changed while it is being rendered, so while
+        this is enabled changes should be made through C{call_after_render()}.
+        The C{StripCharter}, zooming, and resizing do so already.
+        Callbacks connected to the C{draw_event} are called on the wxPython
+        thread once the frame is ready to be shown.
+        """
+        self.threadedRendering = (state
+            and _convert_agg_to_wx_bitmap is not None)
+
+    def set_max_frame_rate(self, fps):
+        """
+        Limit the draws made by C{request_draw()} to at most C{fps} frames per
+        second, or remove the limit if C{fps} is C{None}.
+        """
+        self.maxFrameRate = fps
+
     def zoomed(self, axes):
         """
         Returns a boolean indicating whether or not the C{axes} is zoomed in.
         """
         return self.director.zoomed(axes)
 
+    def get_draw_statistics(self):
+        """
+        Returns the number of calls to C{request_draw()} and the number of
+        those requests that were coalesced into an already pending draw as the
+        2-tuple C{(requested, coalesced)}.
+        """
+        return self.drawRequests, self.coalescedDraws
+
+    def get_draw_duration(self):
+        """
+        Returns the number of seconds it took to render the figure the last
+        time it was drawn.
+        """
+        return self.drawDuration
+
+    def is_draw_pending(self):
+        """
+        Returns a boolean indicating whether a draw has been requested but not
+        made yet, or is being rendered on a worker thread.
+        """
+        return self.drawPending or self.renderThread is not None
+
+    def is_rendering(self):
+        """
+        Returns a boolean indicating whether the figure is being rendered on a
+        worker thread, during which it must not be changed.
+        """
+        return self.renderThread is not None
+
+    def call_after_render(self, func):
+        """
+        Calls C{func} without arguments now, or on the wxPython thread once
+        the figure has been rendered if it is being rendered on a worker
+        thread.
+        """
+        if self.renderThread is None:
+            func()
+        else:
+            self.afterRender.append(func)
+
+    def request_draw(self):
+        """
+        Draw the associated C{Figure} onto the screen once the pending wxPython
+        events have been processed.  Further requests made before then are
+        coalesced into that one draw, which is also delayed as necessary to
+        respect the maximum frame rate.
+        """
+        self.drawRequests += 1
+        if self.drawPending:
+            self.coalescedDraws += 1
+            return
+
+        self.drawPending = True
+
+        delay = 0.0
+        if self.maxFrameRate:
+            delay = self.lastDrawTime + 1.0/self.maxFrameRate - time.time()
+
+        if delay > 0.0:
+            wx.CallLater(int(delay*1000) + 1, self._onRequestedDraw)
+        else:
+            wx.CallAfter(self._onRequestedDraw)
+
+    def _onRequestedDraw(self):
+        """
+        Performs the draw scheduled by C{request_draw()}, unless the figure
+        has been drawn in the meantime.
+        """
+        # avoid wxPyDeadObject errors
+        if not isinstance(self, FigureCanvasWxAgg):
+            return
+
+        if self.drawPending:
+            self.draw()
+
     def draw(self, **kwds):
         """
         Draw the associated C{Figure} onto the screen.
         """
+        self.drawPending = False
+
         # don't redraw if the left mouse button is down and avoid
         # wxPyDeadObject errors
         if (not self.director.canDraw()
         or  not isinstance(self, FigureCanvasWxAgg)):
             return
 
-        if MATPLOTLIB_0_98_3:
-            FigureCanvasWxAgg.draw(self, kwds.get('drawDC', None))
-        else:
-            FigureCanvasWxAgg.draw(self, kwds.get('repaint', True))
+        self.lastDrawTime = time.time()
+
+        if self.threadedRendering:
+            # show the previous frame until the new one has been rendered
+            if self.insideOnPaint:
+                self.gui_repaint(drawDC=kwds.get('drawDC', None))
+            self._start_render()
+            return
+
+        self._draw_now(**kwds)
+
+    def _draw_now(self, **kwds):
+        """
+        Draw the associated C{Figure} onto the screen on this thread.
+        """
+        saved = self._reduce_lines()
+        try:
+            if MATPLOTLIB_0_98_3:
+                FigureCanvasWxAgg.draw(self, kwds.get('drawDC', None))
+            else:
+                FigureCanvasWxAgg.draw(self, kwds.get('repaint', True))
+        finally:
+            self.decimator.restore(saved)
+        self.drawDuration = time.time() - self.lastDrawTime
 
         # Don't redraw the decorations when called by _onPaint()
         if not self.insideOnPaint:
@@ -1261,6 +1674,139 @@ class PlotPanel(FigureCanvasWxAgg):
             self.crosshairs.redraw()
             self.rubberband.redraw()
 
+    def _start_render(self):
+        """
+        Renders the figure into an off-screen Agg buffer on a worker thread.
+        If a render is already in progress, its frame will be discarded and
+        another render started when it finishes.
+        """
+        self.renderGeneration += 1
+        if self.renderThread is not None:
+            return
+
+        self.renderSaved = self._reduce_lines()
+
+        l, b, w, h = self.figure.bbox.bounds
+        key = w, h, self.figure.dpi
+        self.renderThread = threading.Thread(name='PlotPanelRenderer',
+            target=self._render, args=(self.renderGeneration, key))
+        self.renderThread.setDaemon(True)
+        self.renderThread.start()
+
+    def _render(self, generation, key):
+        """
+        Draws the figure into a new C{RendererAgg} of the size described by
+        C{key}.  This method is run on a worker thread.
+        """
+        start = time.time()
+        w, h, dpi = key
+        renderer = RendererAgg(w, h, dpi)
+        error = None
+
+        lock = getattr(RendererAgg, 'lock', None)
+        if lock is not None:
+            lock.acquire()
+        try:
+            try:
+                self.figure.draw(renderer)
+            except Exception:
+                renderer = None
+                error = traceback.format_exc()
+        finally:
+            if lock is not None:
+                lock.release()
+
+        self.drawDuration = time.time() - start
+        wx.CallAfter(self._onRenderFinished, generation, key, renderer, error)
+
+    def _onRenderFinished(self, generation, key, renderer, error):
+        """
+        Shows a frame rendered by C{_render()} and makes the changes to the
+        figure that were put off while it was rendered.  If the frame has been
+        made stale by a newer call to C{draw()} the figure is rendered again,
+        and if rendering failed the error is reported and the figure is drawn
+        on this thread instead.
+        """
+        # avoid wxPyDeadObject errors
+        if not isinstance(self, FigureCanvasWxAgg):
+            return
+
+        self.renderThread = None
+        stale = generation != self.renderGeneration
+
+        if not stale and renderer is not None:
+            # make the rendered buffer the canvas' own, so blitting works
+            self.renderer = renderer
+            self._lastKey = key
+            self.draw_event(renderer)
+            self.bitmap = _convert_agg_to_wx_bitmap(renderer, None)
+            self._isDrawn = True
+            self.gui_repaint()
+
+            self.location.redraw()
+            self.crosshairs.redraw()
+            self.rubberband.redraw()
+
+        self.decimator.restore(self.renderSaved)
+        self.renderSaved = []
+
+        afterRender, self.afterRender = self.afterRender, []
+        for func in afterRender:
+            func()
+
+        if self.renderThread is not None:
+            return
+        elif stale:
+            self._start_render()
+        elif renderer is None:
+            sys.stderr.write('wxmpl: rendering the figure on a worker thread '
+                + 'failed, drawing it directly\n' + error)
+            self._draw_now()
+
+    def _reduce_lines(self):
+        """
+        Reduces the lines of every axes for drawing, returning their original
+        data for C{LineDecimator.restore()}.
+        """
+        saved = []
+        for axes in self.figure.get_axes():
+            saved.extend(self.decimator.reduce(axes))
+        return saved
+
+    def draw_event(self, renderer):
+        """
+        Overrides C{FigureCanvasBase.draw_event()} so that the event for a
+        frame rendered on a worker thread is sent on the wxPython thread, by
+        C{_onRenderFinished()}.
+        """
+        if (self.renderThread is not None
+        and threading.currentThread() is self.renderThread):
+            return
+        FigureCanvasWxAgg.draw_event(self, renderer)
+
+    def _onSize(self, evt):
+        """
+        Overrides the C{FigureCanvasWxAgg} resize event handler so that the
+        figure is not resized while it is being rendered.
+        """
+        self.call_after_render(lambda: FigureCanvasWxAgg._onSize(self, evt))
+
+    def blit(self, bbox=None):
+        """
+        Copy the region C{bbox} of the rendered C{Figure} onto the screen, or
+        the entire figure if C{bbox} is C{None}.
+        """
+        # don't redraw if the left mouse button is down and avoid
+        # wxPyDeadObject errors
+        if (not self.director.canDraw()
+        or  not isinstance(self, FigureCanvasWxAgg)):
+            return
+
+        FigureCanvasWxAgg.blit(self, bbox)
+        self.location.redraw()
+        self.crosshairs.redraw()
+        self.rubberband.redraw()
+
     def notify_point(self, axes, x, y):
         """
         Called by the associated C{PlotPanelDirector} to emit a C{PointEvent}.
@@ -1355,7 +1901,7 @@ class PlotFrame(wx.Frame):
 
     def __init__(self, parent, id, title, size=(6.0, 3.7), dpi=96, cursor=True,
      location=True, crosshairs=True, selection=True, zoom=True,
-     autoscaleUnzoom=True, **kwds):
+     autoscaleUnzoom=True, decimate=False, maxFrameRate=None, **kwds):
         """
         Creates a new PlotFrame top-level window that is the child of the
         wxPython window C{parent} with the wxPython identifier C{id} and the
@@ -1369,7 +1915,8 @@ class PlotFrame(wx.Frame):
         """
         wx.Frame.__init__(self, parent, id, title, **kwds)
         self.panel = PlotPanel(self, -1, size, dpi, cursor, location,
-            crosshairs, selection, zoom)
+            crosshairs, selection, zoom, decimate=decimate,
+            maxFrameRate=maxFrameRate)
 
         pData = wx.PrintData()
         pData.SetPaperId(wx.PAPER_LETTER)
@@ -1540,12 +2087,41 @@ class PlotFrame(wx.Frame):
         """
         self.panel.set_autoscale_unzoom(state)
 
+    def set_decimation(self, state):
+        """
+        Enable or disable reducing lines with many more points than there are
+        pixels across their axes to the minimum and maximum of each pixel
+        column before they are drawn.
+        """
+        self.panel.set_decimation(state)
+
+    def set_threaded_rendering(self, state):
+        """
+        Enable or disable rendering the figure on a worker thread, so that the
+        user interface stays responsive while large figures are rendered.
+        """
+        self.panel.set_threaded_rendering(state)
+
+    def set_max_frame_rate(self, fps):
+        """
+        Limit the draws made by C{request_draw()} to at most C{fps} frames per
+        second, or remove the limit if C{fps} is C{None}.
+        """
+        self.panel.set_max_frame_rate(fps)
+
     def draw(self):
         """
         Draw the associated C{Figure} onto the screen.
         """
         self.panel.draw()
 
+    def request_draw(self):
+        """
+        Draw the associated C{Figure} onto the screen once the pending wxPython
+        events have been processed, coalescing any further requests.
+        """
+        self.panel.request_draw()
+
 
 #
 # wxApp providing a matplotlib canvas in a top-level wxPython window
@@ -1564,7 +2140,8 @@ class PlotApp(wx.App):
     ABOUT_MESSAGE = None
 
     def __init__(self, title="WxMpl", size=(6.0, 3.7), dpi=96, cursor=True,
-     location=True, crosshairs=True, selection=True, zoom=True, **kwds):
+     location=True, crosshairs=True, selection=True, zoom=True,
+     decimate=False, maxFrameRate=None, **kwds):
         """
         Creates a new PlotApp, which creates a PlotFrame top-level window.
 
@@ -1585,12 +2162,15 @@ class PlotApp(wx.App):
         self.crosshairs = crosshairs
         self.selection = selection
         self.zoom = zoom
+        self.decimate = decimate
+        self.maxFrameRate = maxFrameRate
         wx.App.__init__(self, **kwds)
 
     def OnInit(self):
         self.frame = panel = PlotFrame(None, -1, self.title, self.size,
             self.dpi, self.cursor, self.location, self.crosshairs,
-            self.selection, self.zoom)
+            self.selection, self.zoom, decimate=self.decimate,
+            maxFrameRate=self.maxFrameRate)
 
         if self.ABOUT_TITLE is not None:
             panel.ABOUT_TITLE = self.ABOUT_TITLE
@@ -1643,12 +2223,41 @@ class PlotApp(wx.App):
         """
         self.frame.set_zoom(state)
 
+    def set_decimation(self, state):
+        """
+        Enable or disable reducing lines with many more points than there are
+        pixels across their axes to the minimum and maximum of each pixel
+        column before they are drawn.
+        """
+        self.frame.set_decimation(state)
+
+    def set_threaded_rendering(self, state):
+        """
+        Enable or disable rendering the figure on a worker thread, so that the
+        user interface stays responsive while large figures are rendered.
+        """
+        self.frame.set_threaded_rendering(state)
+
+    def set_max_frame_rate(self, fps):
+        """
+        Limit the draws made by C{request_draw()} to at most C{fps} frames per
+        second, or remove the limit if C{fps} is C{None}.
+        """
+        self.frame.set_max_frame_rate(fps)
+
     def draw(self):
         """
         Draw the associated C{Figure} onto the screen.
         """
         self.frame.draw()
 
+    def request_draw(self):
+        """
+        Draw the associated C{Figure} onto the screen once the pending wxPython
+        events have been processed, coalescing any further requests.
+        """
+        self.frame.request_draw()
+
 
 #
 # Automatically resizing vectors and matrices
@@ -1658,29 +2267,58 @@ class VectorBuffer:
     """
     Manages a Numerical Python vector, automatically growing it as necessary to
     accomodate new entries.
+
+    If a C{capacity} is given the buffer is circular: it never holds more than
+    that many entries and appending to a full buffer discards the oldest one.
+
+    The C{appended} attribute counts the entries appended since the buffer was
+    last cleared or reset, so clients can tell which entries are new.
     """
-    def __init__(self):
-        self.data = np.zeros((16,), np.float)
-        self.nextRow = 0
+    def __init__(self, capacity=None, dtype=np.float):
+        """
+        Create a new buffer.  The keyword argument C{capacity} is the maximum
+        number of entries to retain, or C{None} for an unbounded buffer, and
+        C{dtype} is the type of the entries.
+        """
+        if capacity is not None and capacity < 1:
+            raise ValueError('invalid buffer capacity')
+        self.capacity = capacity
+        self.dtype = dtype
+        self.reset()
 
     def clear(self):
         """
         Zero and reset this buffer without releasing the underlying array.
         """
         self.data[:] = 0.0
+        self.start = 0
         self.nextRow = 0
+        self.appended = 0
 
     def reset(self):
         """
         Zero and reset this buffer, releasing the underlying array.
         """
-        self.data = np.zeros((16,), np.float)
+        if self.capacity is None:
+            self.data = np.zeros((16,), self.dtype)
+        else:
+            # every entry is stored twice, `capacity' elements apart, so that
+            # the most recent `capacity' entries are always contiguous
+            self.data = np.zeros((2*self.capacity,), self.dtype)
+        self.start = 0
         self.nextRow = 0
+        self.appended = 0
 
     def append(self, point):
         """
         Append a new entry to the end of this buffer's vector.
         """
+        self.appended += 1
+
+        if self.capacity is not None:
+            self._append_circular(point)
+            return
+
         nextRow = self.nextRow
         data = self.data
 
@@ -1690,12 +2328,86 @@ class VectorBuffer:
             resize = True
 
         if resize:
-            self.data = np.zeros((nR,), np.float)
+            self.data = np.zeros((nR,), self.dtype)
             self.data[0:data.shape[0]] = data
 
         self.data[nextRow] = point
         self.nextRow += 1
 
+    def _append_circular(self, point):
+        """
+        Append a new entry to a circular buffer, overwriting the oldest entry
+        if the buffer is full.
+        """
+        capacity = self.capacity
+
+        if self.nextRow < capacity:
+            idx = self.nextRow
+            self.nextRow += 1
+        else:
+            idx = self.start
+            self.start = (self.start + 1) % capacity
+
+        self.data[idx] = self.data[idx+capacity] = point
+
+    def extend(self, points):
+        """
+        Append a sequence of new entries to the end of this buffer's vector.
+        The underlying array is reallocated at most once.
+        """
+        points = np.asarray(points, self.dtype).ravel()
+        nPts = points.shape[0]
+
+        if nPts == 0:
+            return
+
+        self.appended += nPts
+
+        if self.capacity is not None:
+            self._extend_circular(points, nPts)
+            return
+
+        nextRow = self.nextRow
+        data = self.data
+
+        if data.shape[0] < nextRow + nPts:
+            nR = max(int(np.ceil(data.shape[0]*1.5)), nextRow + nPts)
+            self.data = np.zeros((nR,), self.dtype)
+            self.data[0:nextRow] = data[0:nextRow]
+
+        self.data[nextRow:nextRow+nPts] = points
+        self.nextRow += nPts
+
+    def _extend_circular(self, points, nPts):
+        """
+        Append C{nPts} new entries to a circular buffer, overwriting the
+        oldest entries as necessary.
+        """
+        capacity = self.capacity
+        data = self.data
+
+        if nPts >= capacity:
+            data[0:capacity] = data[capacity:] = points[nPts-capacity:]
+            self.start = 0
+            self.nextRow = capacity
+            return
+
+        idx = (self.start + self.nextRow) % capacity
+        end = idx + nPts
+        data[idx:end] = points
+        if end <= capacity:
+            data[idx+capacity:end+capacity] = points
+        else:
+            data[idx+capacity:] = points[0:capacity-idx]
+            data[0:end-capacity] = points[capacity-idx:]
+
+        total = self.nextRow + nPts
+        if total <= capacity:
+            self.nextRow = total
+        else:
+            self.start = (self.start + total - capacity) % capacity
+            self.nextRow = capacity
+
     def getData(self):
         """
         Returns the current vector or C{None} if the buffer contains no data.
@@ -1703,31 +2415,52 @@ class VectorBuffer:
         if self.nextRow == 0:
             return None
         else:
-            return self.data[0:self.nextRow]
+            return self.data[self.start:self.start+self.nextRow]
 
 
 class MatrixBuffer:
     """
     Manages a Numerical Python matrix, automatically growing it as necessary to
     accomodate new rows of entries.
+
+    If a C{capacity} is given the buffer is circular: it never holds more than
+    that many rows and appending to a full buffer discards the oldest row.
+
+    The C{appended} attribute counts the rows appended since the buffer was
+    last cleared or reset, so clients can tell which rows are new.
     """
-    def __init__(self):
-        self.data = np.zeros((16, 1), np.float)
-        self.nextRow = 0
+    def __init__(self, capacity=None):
+        """
+        Create a new buffer.  The keyword argument C{capacity} is the maximum
+        number of rows to retain, or C{None} for an unbounded buffer.
+        """
+        if capacity is not None and capacity < 1:
+            raise ValueError('invalid buffer capacity')
+        self.capacity = capacity
+        self.reset()
 
     def clear(self):
         """
         Zero and reset this buffer without releasing the underlying array.
         """
         self.data[:, :] = 0.0
+        self.start = 0
         self.nextRow = 0
+        self.appended = 0
 
     def reset(self):
         """
         Zero and reset this buffer, releasing the underlying array.
         """
-        self.data = np.zeros((16, 1), np.float)
+        if self.capacity is None:
+            self.data = np.zeros((16, 1), np.float)
+        else:
+            # every row is stored twice, `capacity' rows apart, so that the
+            # most recent `capacity' rows are always contiguous
+            self.data = np.zeros((2*self.capacity, 1), np.float)
+        self.start = 0
         self.nextRow = 0
+        self.appended = 0
 
     def append(self, row):
         """
@@ -1741,6 +2474,12 @@ class MatrixBuffer:
         if nPts == 0:
             return
 
+        self.appended += 1
+
+        if self.capacity is not None:
+            self._append_circular(row, nPts)
+            return
+
         resize = True
         if nextRow == data.shape[0]:
             nC = data.shape[1]
@@ -1761,6 +2500,112 @@ class MatrixBuffer:
         self.data[nextRow, 0:nPts] = row
         self.nextRow += 1
 
+    def _append_circular(self, row, nPts):
+        """
+        Append a new row of C{nPts} entries to a circular buffer, overwriting
+        the oldest row if the buffer is full.
+        """
+        capacity = self.capacity
+        data = self.data
+
+        if data.shape[1] < nPts:
+            self.data = np.zeros((data.shape[0], nPts), np.float)
+            self.data[:, 0:data.shape[1]] = data
+            data = self.data
+
+        if self.nextRow < capacity:
+            idx = self.nextRow
+            self.nextRow += 1
+        else:
+            idx = self.start
+            self.start = (self.start + 1) % capacity
+
+        data[idx, 0:nPts] = row
+        data[idx, nPts:] = 0.0
+        data[idx+capacity, :] = data[idx, :]
+
+    def reserve(self, nRows):
+        """
+        Make room for at least C{nRows} rows, so that they can be appended
+        without reallocating the underlying array.  Circular buffers are
+        unaffected.
+        """
+        data = self.data
+        if self.capacity is None and data.shape[0] < nRows:
+            self.data = np.zeros((nRows, data.shape[1]), np.float)
+            self.data[0:self.nextRow, :] = data[0:self.nextRow, :]
+
+    def extend(self, rows):
+        """
+        Append a block of rows to the end of this buffer's matrix.  C{rows} may
+        be a 2-D array or a sequence of rows, which need not all be the same
+        length.  The underlying array is reallocated at most once.
+        """
+        block = as_row_block(rows)
+        nRows, nPts = block.shape
+
+        if nRows == 0 or nPts == 0:
+            return
+
+        self.appended += nRows
+
+        if self.capacity is not None:
+            self._extend_circular(block, nRows, nPts)
+            return
+
+        nextRow = self.nextRow
+        data = self.data
+        nR, nC = data.shape
+
+        if nR < nextRow + nRows or nC < nPts:
+            if nR < nextRow + nRows:
+                nR = max(int(np.ceil(nR*1.5)), nextRow + nRows)
+            if nC < nPts:
+                nC = nPts
+            self.data = np.zeros((nR, nC), np.float)
+            self.data[0:nextRow, 0:data.shape[1]] = data[0:nextRow, :]
+
+        self.data[nextRow:nextRow+nRows, 0:nPts] = block
+        self.nextRow += nRows
+
+    def _extend_circular(self, block, nRows, nPts):
+        """
+        Append a block of C{nRows} rows of C{nPts} entries to a circular
+        buffer, overwriting the oldest rows as necessary.
+        """
+        capacity = self.capacity
+        data = self.data
+
+        if data.shape[1] < nPts:
+            self.data = np.zeros((data.shape[0], nPts), np.float)
+            self.data[:, 0:data.shape[1]] = data
+            data = self.data
+
+        if nRows >= capacity:
+            data[0:capacity, :] = 0.0
+            data[0:capacity, 0:nPts] = block[nRows-capacity:]
+            data[capacity:, :] = data[0:capacity, :]
+            self.start = 0
+            self.nextRow = capacity
+            return
+
+        idx = (self.start + self.nextRow) % capacity
+        end = idx + nRows
+        data[idx:end, 0:nPts] = block
+        data[idx:end, nPts:] = 0.0
+        if end <= capacity:
+            data[idx+capacity:end+capacity, :] = data[idx:end, :]
+        else:
+            data[idx+capacity:, :] = data[idx:capacity, :]
+            data[0:end-capacity, :] = data[capacity:end, :]
+
+        total = self.nextRow + nRows
+        if total <= capacity:
+            self.nextRow = total
+        else:
+            self.start = (self.start + total - capacity) % capacity
+            self.nextRow = capacity
+
     def getData(self):
         """
         Returns the current matrix or C{None} if the buffer contains no data.
@@ -1768,7 +2613,36 @@ class MatrixBuffer:
         if self.nextRow == 0:
             return None
         else:
-            return self.data[0:self.nextRow, :]
+            return self.data[self.start:self.start+self.nextRow, :]
+
+
+def as_row_block(rows):
+    """
+    Converts a 2-D array or a sequence of rows into a 2-D array of floats.
+    Rows shorter than the longest row are padded with zeros and empty rows are
+    discarded.
+    """
+    try:
+        block = np.asarray(rows, np.float)
+    except ValueError:
+        block = None
+
+    if block is not None:
+        if block.ndim == 2:
+            return block
+        elif block.ndim == 1 and block.shape[0] == 0:
+            return np.zeros((0, 0), np.float)
+        else:
+            raise ValueError('expected a 2-D array or a sequence of rows')
+
+    rows = [x for x in rows if len(x)]
+    if not rows:
+        return np.zeros((0, 0), np.float)
+
+    block = np.zeros((len(rows), max([len(x) for x in rows])), np.float)
+    for i, row in enumerate(rows):
+        block[i, 0:len(row)] = row
+    return block
 
 
 #
@@ -1787,17 +2661,119 @@ def get_delta(X1, X2):
     """
     Returns the vector of contiguous, different points between two vectors.
     """
-    n1 = X1.shape[0]
+    return get_new_points(X1.shape[0], X2)
+
+
+def get_new_points(n1, X2):
+    """
+    Returns the vector of contiguous, different points in C{X2} given that the
+    first C{n1} points have already been seen.
+    """
     n2 = X2.shape[0]
 
     if n1 < n2:
         return X2[n1:]
-    elif n1 == n2:
+    else:
         # shape is no longer a reliable indicator of change, so assume things
         # are different
         return X2
-    else:
-        return X2
+
+
+class WindowExtents:
+    """
+    Tracks the extents of a window of the most recent points of a line, to
+    which points are appended at one end and discarded from the other.  The
+    extents of the oldest points come from their running minima and maxima
+    taken from the end, which are recomputed only once all of those points
+    have been discarded, so the amortized cost of an update is proportional
+    to the number of new points rather than the size of the window.
+    """
+    def __init__(self):
+        self.appended = None
+        self.extents = None
+        self.frontStart = 0
+        self.front = None
+        self.back = None
+
+    def update(self, X, Y, appended):
+        """
+        Update the extents for the vectors C{X} and C{Y} of the most recent
+        points after C{appended} points have been appended in total, and
+        return them as the 4-tuple C{(xmin, ymin, xmax, ymax)}, which is also
+        kept as the C{extents} attribute.  Points that are not finite are
+        ignored and an extent is C{NaN} if there are none.
+        """
+        nPts = X.shape[0]
+        if nPts == 0:
+            self.__init__()
+            self.appended = appended
+            self.extents = (np.nan,) * 4
+            return self.extents
+
+        windowStart = appended - nPts
+
+        if self.appended is None:
+            new = nPts
+        else:
+            new = appended - self.appended
+        self.appended = appended
+
+        if (self.front is None or new < 0 or new >= nPts
+        or windowStart >= self.frontStart + self.front[0].shape[0]):
+            self._rebuild(X, Y, windowStart)
+        elif new:
+            self.back = combine_extents(self.back,
+                get_extents(X[nPts-new:], Y[nPts-new:]))
+
+        front = [x[windowStart - self.frontStart] for x in self.front]
+        self.extents = combine_extents(front, self.back)
+        return self.extents
+
+    def _rebuild(self, X, Y, windowStart):
+        """
+        Make every point in the window one of the oldest points.
+        """
+        X = as_finite_floats(X)
+        Y = as_finite_floats(Y)
+        self.frontStart = windowStart
+        self.front = (np.fmin.accumulate(X[::-1])[::-1],
+            np.fmin.accumulate(Y[::-1])[::-1],
+            np.fmax.accumulate(X[::-1])[::-1],
+            np.fmax.accumulate(Y[::-1])[::-1])
+        self.back = None
+
+
+def as_finite_floats(X):
+    """
+    Returns a vector of the values of C{X} with masked and infinite values
+    replaced by C{NaN}.
+    """
+    X = np.ma.filled(np.ma.asarray(X, np.float), np.nan)
+    return np.where(np.isinf(X), np.nan, X)
+
+
+def get_extents(X, Y):
+    """
+    Returns the extents of the finite points of C{X} and C{Y} as the 4-tuple
+    C{(xmin, ymin, xmax, ymax)}.
+    """
+    X = as_finite_floats(X)
+    Y = as_finite_floats(Y)
+    return (np.fmin.reduce(X), np.fmin.reduce(Y), np.fmax.reduce(X),
+        np.fmax.reduce(Y))
+
+
+def combine_extents(e1, e2):
+    """
+    Returns the union of two 4-tuples of extents, either of which may be
+    C{None}.
+    """
+    if e1 is None:
+        return e2
+    elif e2 is None:
+        return e1
+    return (np.fmin(e1[0], e2[0]), np.fmin(e1[1], e2[1]),
+        np.fmax(e1[2], e2[2]), np.fmax(e1[3], e2[3]))
 
 
 def make_bbox(X, Y):
@@ -1807,14 +2783,14 @@ def make_bbox(X, Y):
     if X is None or X.shape[0] == 0:
         x1 = x2 = 0.0
     else:
-        x1 = min(X)
-        x2 = max(X)
+        x1 = X.min()
+        x2 = X.max()
 
     if Y is None or Y.shape[0] == 0:
         y1 = y2 = 0.0
     else:
-        y1 = min(Y)
-        y2 = max(Y)
+        y1 = Y.min()
+        y2 = Y.max()
 
     return Bbox.from_extents(x1, y1, x2, y2)
 
@@ -1827,13 +2803,27 @@ class StripCharter:
     """
     Plots and updates lines on a matplotlib C{Axes}.
     """
-    def __init__(self, axes):
+    def __init__(self, axes, blit=False):
         """
         Create a new C{StripCharter} associated with a matplotlib C{axes}.
+
+        If the keyword argument C{blit} is true, updates that do not change
+        the axes limits only redraw the lines on top of a cached copy of the
+        rest of the axes, instead of redrawing the entire figure.  Changes to
+        anything other than the channels' data, such as the axes title, will
+        not appear until the next time the figure is drawn.
         """
         self.axes = axes
         self.channels = []
         self.lines = {}
+        self.blit = blit
+        self.background = None
+        self.backgroundKey = None
+        self.relimit = False
+        self.updateDeferred = False
+
+        if blit:
+            axes.figure.canvas.mpl_connect('draw_event', self._onDraw)
 
     def setChannels(self, channels):
         """
@@ -1849,12 +2839,25 @@ class StripCharter:
     def update(self):
         """
         Redraw the associated axes with updated lines if any of the channels'
-        data has changed.
+        data has changed.  Full redraws of the figure are made through the
+        canvas' C{request_draw()}, so several updates in a row are coalesced.
         """
         axes = self.axes
         figureCanvas = axes.figure.canvas
 
-        zoomed = figureCanvas.zoomed(axes)
+        # the lines cannot be changed while the figure is being rendered
+        isRendering = getattr(figureCanvas, 'is_rendering', None)
+        if isRendering is not None and isRendering():
+            if not self.updateDeferred:
+                self.updateDeferred = True
+                figureCanvas.call_after_render(self._deferred_update)
+            return
+
+        # plain matplotlib canvases are simply redrawn
+        zoomed = getattr(figureCanvas, 'zoomed', None)
+        zoomed = zoomed is not None and zoomed(axes)
+        requestDraw = getattr(figureCanvas, 'request_draw', figureCanvas.draw)
+        isDrawPending = getattr(figureCanvas, 'is_draw_pending', None)
 
         redraw = False
         if self.lines is None:
@@ -1864,10 +2867,100 @@ class StripCharter:
             for channel in self.channels:
                 redraw = self._update_channel(channel, zoomed) or redraw
 
+        if self.relimit:
+            self._relimit()
+
         if redraw:
             if not zoomed:
                 axes.autoscale_view()
-            figureCanvas.draw()
+
+            if isDrawPending is not None and isDrawPending():
+                pass
+            elif (self.blit and self.background is not None
+            and self.backgroundKey == self._get_background_key()):
+                self._blit_lines()
+            else:
+                requestDraw()
+
+    def _deferred_update(self):
+        """
+        Makes an update that was put off while the figure was rendered.
+        """
+        self.updateDeferred = False
+        self.update()
+
+    def _relimit(self):
+        """
+        Recompute the data limits of the axes from the current windows of the
+        lines, and the other lines and patches of the axes.
+        """
+        self.relimit = False
+        axes = self.axes
+
+        extents = {}
+        for line in (self.lines or {}).values():
+            if line._wxmpl_extents.extents is not None:
+                extents[line] = line._wxmpl_extents.extents
+
+        axes.dataLim.set_points(Bbox.null().get_points())
+        axes.ignore_existing_data_limits = True
+        for line in axes.lines:
+            if not extents.has_key(line):
+                axes._update_line_limits(line)
+                continue
+
+            window = extents[line]
+            if np.all(np.isfinite(window)):
+                axes.update_datalim([window[0:2], window[2:4]])
+        for patch in axes.patches:
+            axes._update_patch_limits(patch)
+
+    def _onDraw(self, evt):
+        """
+        Handles matplotlib draw events by caching the background of the axes,
+        which excludes the animated lines, and then drawing the lines on top
+        of it.
+        """
+        if not self.lines:
+            self.background = None
+            return
+
+        axes = self.axes
+        self.background = evt.renderer.copy_from_bbox(axes.bbox)
+        self.backgroundKey = self._get_background_key()
+        for line in self.lines.values():
+            if not line._wxmpl_empty_line:
+                axes.draw_artist(line)
+
+    def _get_background_key(self):
+        """
+        Returns the view limits and screen location of the axes, which must
+        not change for the cached background to remain valid.
+        """
+        axes = self.axes
+        return tuple(axes.viewLim.bounds), tuple(axes.bbox.bounds)
+
+    def _blit_lines(self):
+        """
+        Redraws the lines on top of the cached background of the axes and
+        copies the result onto the screen.
+        """
+        axes = self.axes
+        figureCanvas = axes.figure.canvas
+
+        saved = []
+        decimator = getattr(figureCanvas, 'decimator', None)
+        if decimator is not None:
+            saved = decimator.reduce(axes)
+        try:
+            figureCanvas.restore_region(self.background)
+            for line in self.lines.values():
+                if not line._wxmpl_empty_line:
+                    axes.draw_artist(line)
+        finally:
+            if decimator is not None:
+                decimator.restore(saved)
+        figureCanvas.blit(axes.bbox)
 
     def _create_plot(self):
         """
@@ -1886,6 +2979,12 @@ class StripCharter:
             self.axes.legend(lines, labels, numpoints=2,
                 prop=FontProperties(size='x-small'))
 
+        # the legend must be created before the lines are made animated, or
+        # the legend's copies of them will not be drawn either
+        if self.blit:
+            for line in self.lines.values():
+                line.set_animated(True)
+
     def _plot_channel(self, channel, styleGen):
         """
         Initially plot a line corresponding to one of the data-providers.
@@ -1899,6 +2998,14 @@ class StripCharter:
 
         line = styleGen(x, y).next()
         line._wxmpl_empty_line = empty
+        line._wxmpl_point_count = len(x)
+        line._wxmpl_appended = None
+        line._wxmpl_extents = WindowExtents()
+        if not empty:
+            line._wxmpl_appended = channel.getAppended()
+            if line._wxmpl_appended is not None:
+                line._wxmpl_extents.update(np.asarray(x), np.asarray(y),
+                    line._wxmpl_appended)
 
         if channel.getColor() is not None:
             line.set_color(channel.getColor())
@@ -1932,15 +3039,41 @@ class StripCharter:
         if newX is None or newY is None:
             return False
 
-        oldX = line._x
-        oldY = line._y
+        # only the points added since the last update need to be folded into
+        # the data limits, so the cost of an update does not depend on how
+        # many points the line already has.  Channels that count the points
+        # appended to them say how many are new, even once the oldest points
+        # are being discarded, and otherwise the growth of the line is used.
+        count = newX.shape[0]
+        appended = channel.getAppended()
+        oldCount = line._wxmpl_point_count
+        if appended is not None and line._wxmpl_appended is not None:
+            new = appended - line._wxmpl_appended
+            if 0 < new < count:
+                oldCount = count - new
+            else:
+                oldCount = 0
+
+        x = get_new_points(oldCount, newX)
+        y = get_new_points(oldCount, newY)
 
-        x, y = newX, newY
-        line.set_data(x, y)
+        line.set_data(newX, newY)
+        line._wxmpl_point_count = count
+        line._wxmpl_appended = appended
+
+        # once the oldest points are being discarded the data limits must
+        # shrink with the window, so they are recomputed from the extents of
+        # the lines' windows
+        extents = None
+        if appended is not None and line.get_transform() == axes.transData:
+            extents = line._wxmpl_extents.update(newX, newY, appended)
+            self.relimit = self.relimit or appended > count
 
         if line._wxmpl_empty_line:
             axes.add_line(line)
             line._wxmpl_empty_line = False
+        elif extents is not None and self.relimit:
+            pass
         else:
             if line.get_transform() != axes.transData:
                 xys = axes._get_verts_in_data_coords(
@@ -1952,8 +3085,7 @@ class StripCharter:
             axes.update_datalim(xys)
 
         if zoomed:
-            return axes.viewLim.overlaps(
-                make_delta_bbox(oldX, oldY, newX, newY))
+            return axes.viewLim.overlaps(make_bbox(x, y))
         else:
             return True
 
@@ -2036,3 +3168,12 @@ class Channel:
         """
         return None
 
+    def getAppended(self):
+        """
+        Template method that returns the number of points that have been
+        appended to the X and Y data since it was last replaced, or C{None} if
+        the data is not only appended to.  A C{StripCharter} uses this count
+        to find the new points once the oldest points are being discarded.
+        """
+        return None
+